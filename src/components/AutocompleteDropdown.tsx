@@ -0,0 +1,84 @@
+import React, { useEffect, useRef, useState } from 'react';
+
+// Rows have a fixed height so the visible slice can be computed from scrollTop alone
+const ROW_HEIGHT = 40; // py-2 + one line of text - rows never wrap (long names are truncated)
+const MAX_HEIGHT = 240; // max-h-60 on the list container
+const OVERSCAN = 3; // Extra rows rendered above and below the viewport
+
+interface AutocompleteDropdownProps {
+  options: string[];
+  highlightedIndex: number;
+  onSelect: (option: string) => void;
+}
+
+export default function AutocompleteDropdown({
+  options,
+  highlightedIndex,
+  onSelect
+}: AutocompleteDropdownProps) {
+  const listRef = useRef<HTMLDivElement>(null);
+  const [scrollTop, setScrollTop] = useState(0);
+
+  // New suggestions start scrolled to the top
+  useEffect(() => {
+    if (listRef.current) {
+      listRef.current.scrollTop = 0;
+    }
+    setScrollTop(0);
+  }, [options]);
+
+  // Keep the keyboard-highlighted row inside the viewport
+  useEffect(() => {
+    const list = listRef.current;
+    if (!list || highlightedIndex < 0) return;
+
+    const rowTop = highlightedIndex * ROW_HEIGHT;
+    if (rowTop < list.scrollTop) {
+      list.scrollTop = rowTop;
+    } else if (rowTop + ROW_HEIGHT > list.scrollTop + list.clientHeight) {
+      list.scrollTop = rowTop + ROW_HEIGHT - list.clientHeight;
+    }
+  }, [highlightedIndex]);
+
+  // With the current suggestion cap every row fits in the window, so scrolling needn't re-render
+  const isWindowed = options.length > Math.ceil(MAX_HEIGHT / ROW_HEIGHT) + OVERSCAN;
+
+  const firstIndex = Math.max(0, Math.floor(scrollTop / ROW_HEIGHT) - OVERSCAN);
+  const lastIndex = Math.min(
+    options.length,
+    Math.ceil((scrollTop + MAX_HEIGHT) / ROW_HEIGHT) + OVERSCAN
+  );
+
+  const rows: React.ReactNode[] = [];
+  for (let index = firstIndex; index < lastIndex; index++) {
+    const option = options[index];
+    rows.push(
+      <button
+        key={option}
+        type="button"
+        title={option}
+        onClick={() => onSelect(option)}
+        style={{ position: 'absolute', top: index * ROW_HEIGHT, height: ROW_HEIGHT }}
+        className={`w-full text-left px-4 py-2 truncate focus:outline-none transition-colors ${
+          index === highlightedIndex
+            ? 'bg-blue-100 text-blue-900'
+            : 'hover:bg-blue-50'
+        }`}
+      >
+        {option}
+      </button>
+    );
+  }
+
+  return (
+    <div
+      ref={listRef}
+      onScroll={isWindowed ? event => setScrollTop(event.currentTarget.scrollTop) : undefined}
+      className="absolute z-10 w-full mt-1 bg-white border border-gray-300 rounded-lg shadow-lg max-h-60 overflow-y-auto"
+    >
+      <div style={{ position: 'relative', height: options.length * ROW_HEIGHT }}>
+        {rows}
+      </div>
+    </div>
+  );
+}
@@ -1,11 +1,21 @@
-import React, { useState, useEffect, useRef, useCallback, useMemo } from 'react';
+import React, {
+    useState,
+    useEffect,
+    useRef,
+    useCallback,
+    useMemo,
+    useDeferredValue,
+    useReducer,
+    startTransition,
+} from 'react';
 import {
     getRandomCardFromSets,
     getCardNameAutocomplete,
     getCardNameAutocompleteFromSets,
     getCardImageUrl,
-    cardNamesMatch,
+    normalizeCardName,
     generateMultipleChoiceOptions,
+    isAbortError,
 } from '../services/scryfall';
 import {
     loadGameState,
@@ -14,6 +24,8 @@ import {
 } from '../services/persistence';
 import type { ScryfallCard, GameState } from '../types';
 import MultipleChoiceInput from './MultipleChoiceInput';
+import AutocompleteDropdown from './AutocompleteDropdown';
+import ScoreHeader from './ScoreHeader';
 
 interface CardGuessingGameProps {
     selectedSets: string[];
@@ -28,36 +40,298 @@ function isMobileDevice(): boolean {
     );
 }
 
+// Frame colors for the name overlay keyed on the joined color identity
+// Colorless and mono-colored identities are listed; every other identity is multi-colored
+const FRAME_BY_IDENTITY: Readonly<Record<string, string>> = Object.freeze({
+    '': '#C0C0C0', // Colorless/Artifact - light gray
+    W: '#FFFBD5', // White - cream
+    U: '#0E68AB', // Blue
+    B: '#150B00', // Black
+    R: '#D3202A', // Red
+    G: '#00733E', // Green
+});
+
 // Helper function to get card frame color for overlay (completely opaque)
-function getCardFrameColor(card: ScryfallCard): string {
-    // Determine overlay color based on card colors/type - fully opaque
-    const colors = card.color_identity || [];
-
-    if (colors.length === 0) {
-        // Colorless/Artifact
-        return '#C0C0C0'; // Light gray
-    } else if (colors.length === 1) {
-        // Mono-colored
-        switch (colors[0]) {
-            case 'W':
-                return '#FFFBD5'; // White - cream
-            case 'U':
-                return '#0E68AB'; // Blue
-            case 'B':
-                return '#150B00'; // Black
-            case 'R':
-                return '#D3202A'; // Red
-            case 'G':
-                return '#00733E'; // Green
-            default:
-                return '#F5F5DC'; // Default cream
+// Takes the joined color identity, e.g. 'WU' - one letter per color
+function getCardFrameColor(colorIdentity: string): string {
+    // Multi-colored is gold, unknown mono-color is cream
+    return (
+        FRAME_BY_IDENTITY[colorIdentity] ??
+        (colorIdentity.length > 1 ? '#F4E164' : '#F5F5DC')
+    );
+}
+
+// Autocomplete suggestion cache limits (keyed by lowercased query)
+const AUTOCOMPLETE_LIMIT = 8;
+const AUTOCOMPLETE_CACHE_SIZE = 200;
+const AUTOCOMPLETE_IDLE_TIMEOUT = 300; // Upper bound on waiting for an idle slot (ms)
+const AUTOCOMPLETE_BURST_WINDOW = 300; // Keystrokes closer together than this form one burst (ms)
+
+// Start downloading and decoding a card image ahead of the <img> that will show it
+function preloadCardImage(card: ScryfallCard): void {
+    const image = new Image();
+    image.decoding = 'async';
+    image.src = getCardImageUrl(card, 'normal');
+}
+
+// Run a callback in a browser idle slot, returning a function that cancels it
+function scheduleIdle(callback: () => void, timeout: number): () => void {
+    if (typeof window.requestIdleCallback === 'function') {
+        const id = window.requestIdleCallback(callback, { timeout });
+        return () => window.cancelIdleCallback(id);
+    }
+    // Safari has no requestIdleCallback - wait for the next frame so a burst of
+    // keystrokes within one frame collapses into a single request
+    const id = window.requestAnimationFrame(callback);
+    return () => window.cancelAnimationFrame(id);
+}
+
+// Look up suggestions for a query, deriving them from a cached shorter prefix when possible
+function getCachedSuggestions(
+    cache: Map<string, string[]>,
+    query: string
+): string[] | null {
+    const exact = cache.get(query);
+    if (exact) {
+        // Refresh recency - Map insertion order doubles as LRU order
+        cache.delete(query);
+        cache.set(query, exact);
+        return exact;
+    }
+
+    for (let length = query.length - 1; length >= 2; length--) {
+        const prefixSuggestions = cache.get(query.slice(0, length));
+        if (!prefixSuggestions) continue;
+
+        // A prefix below the result limit already contains every match for the longer query
+        if (prefixSuggestions.length >= AUTOCOMPLETE_LIMIT) return null;
+        return prefixSuggestions
+            .filter((name) => name.toLowerCase().includes(query))
+            .sort((a, b) => {
+                const aStarts = a.toLowerCase().startsWith(query);
+                const bStarts = b.toLowerCase().startsWith(query);
+                if (aStarts !== bStarts) return aStarts ? -1 : 1;
+                return a.localeCompare(b);
+            });
+    }
+
+    return null;
+}
+
+function cacheSuggestions(
+    cache: Map<string, string[]>,
+    query: string,
+    suggestions: string[]
+): void {
+    cache.delete(query);
+    cache.set(query, suggestions);
+    if (cache.size > AUTOCOMPLETE_CACHE_SIZE) {
+        cache.delete(cache.keys().next().value as string);
+    }
+}
+
+// Autocomplete dropdown state - kept in the same store as the game so one action updates both
+interface AutocompleteState {
+    options: string[];
+    isOpen: boolean;
+    highlightedIndex: number;
+}
+
+interface GameViewState {
+    game: GameState;
+    autocomplete: AutocompleteState;
+}
+
+type GameAction =
+    | {
+          type: 'SUBMIT';
+          guess: string;
+          isCorrect: boolean;
+          selectedChoice: string | null;
+      }
+    | { type: 'SKIP' }
+    | { type: 'LOAD_START' }
+    | {
+          type: 'LOAD_OK';
+          card: ScryfallCard;
+          multipleChoiceOptions: GameState['multipleChoiceOptions'];
+      }
+    | { type: 'LOAD_FAIL' }
+    | { type: 'RESTORE'; game: GameState }
+    | { type: 'RESET_SCORES' }
+    | { type: 'SET_INPUT_MODE'; inputMode: GameState['inputMode'] }
+    | {
+          type: 'SET_CHOICES';
+          multipleChoiceOptions: GameState['multipleChoiceOptions'];
+      }
+    | { type: 'SHOW_SUGGESTIONS'; options: string[] }
+    | { type: 'CLEAR_SUGGESTIONS' }
+    | { type: 'CLOSE_SUGGESTIONS' }
+    | { type: 'MOVE_HIGHLIGHT'; step: 1 | -1 };
+
+const EMPTY_AUTOCOMPLETE: AutocompleteState = {
+    options: [],
+    isOpen: false,
+    highlightedIndex: -1,
+};
+
+function createInitialState(
+    inputMode: GameState['inputMode']
+): GameViewState {
+    return {
+        game: {
+            currentCard: null,
+            isLoading: false,
+            isGuessSubmitted: false,
+            lastGuess: '',
+            isCorrectGuess: null,
+            score: 0,
+            streak: 0,
+            totalGuesses: 0,
+            inputMode: inputMode,
+            multipleChoiceOptions: [],
+            selectedChoice: null,
+        },
+        autocomplete: EMPTY_AUTOCOMPLETE,
+    };
+}
+
+// Hide the dropdown, returning the same object when nothing changes so React can bail out
+function closeAutocomplete(autocomplete: AutocompleteState): AutocompleteState {
+    if (!autocomplete.isOpen && autocomplete.highlightedIndex === -1) {
+        return autocomplete;
+    }
+    return { ...autocomplete, isOpen: false, highlightedIndex: -1 };
+}
+
+function gameReducer(state: GameViewState, action: GameAction): GameViewState {
+    switch (action.type) {
+        case 'SUBMIT':
+            return {
+                game: {
+                    ...state.game,
+                    isGuessSubmitted: true,
+                    lastGuess: action.guess,
+                    isCorrectGuess: action.isCorrect,
+                    score: action.isCorrect
+                        ? state.game.score + 1
+                        : state.game.score,
+                    streak: action.isCorrect ? state.game.streak + 1 : 0,
+                    totalGuesses: state.game.totalGuesses + 1,
+                    selectedChoice: action.selectedChoice,
+                },
+                autocomplete: closeAutocomplete(state.autocomplete),
+            };
+        case 'SKIP':
+            return {
+                game: {
+                    ...state.game,
+                    isGuessSubmitted: true,
+                    lastGuess: '',
+                    isCorrectGuess: false,
+                    streak: 0,
+                    totalGuesses: state.game.totalGuesses + 1,
+                    selectedChoice: null,
+                },
+                autocomplete: closeAutocomplete(state.autocomplete),
+            };
+        case 'LOAD_START':
+            return { ...state, game: { ...state.game, isLoading: true } };
+        case 'LOAD_OK':
+            return {
+                game: {
+                    ...state.game,
+                    currentCard: action.card,
+                    isLoading: false,
+                    isGuessSubmitted: false,
+                    lastGuess: '',
+                    isCorrectGuess: null,
+                    multipleChoiceOptions: action.multipleChoiceOptions,
+                    selectedChoice: null,
+                },
+                autocomplete: EMPTY_AUTOCOMPLETE,
+            };
+        case 'LOAD_FAIL':
+            return {
+                ...state,
+                game: { ...state.game, isLoading: false, currentCard: null },
+            };
+        case 'RESTORE':
+            return { ...state, game: action.game };
+        case 'RESET_SCORES':
+            return {
+                ...state,
+                game: {
+                    ...state.game,
+                    score: 0,
+                    streak: 0,
+                    totalGuesses: 0,
+                    currentCard: null,
+                    isGuessSubmitted: false,
+                    lastGuess: '',
+                    isCorrectGuess: null,
+                    multipleChoiceOptions: [],
+                    selectedChoice: null,
+                },
+            };
+        case 'SET_INPUT_MODE':
+            return {
+                ...state,
+                game: { ...state.game, inputMode: action.inputMode },
+            };
+        case 'SET_CHOICES':
+            return {
+                ...state,
+                game: {
+                    ...state.game,
+                    multipleChoiceOptions: action.multipleChoiceOptions,
+                },
+            };
+        case 'SHOW_SUGGESTIONS':
+            return {
+                ...state,
+                autocomplete: {
+                    options: action.options,
+                    isOpen: action.options.length > 0,
+                    highlightedIndex: -1,
+                },
+            };
+        case 'CLEAR_SUGGESTIONS':
+            return state.autocomplete === EMPTY_AUTOCOMPLETE
+                ? state
+                : { ...state, autocomplete: EMPTY_AUTOCOMPLETE };
+        case 'CLOSE_SUGGESTIONS': {
+            const autocomplete = closeAutocomplete(state.autocomplete);
+            return autocomplete === state.autocomplete
+                ? state
+                : { ...state, autocomplete };
+        }
+        case 'MOVE_HIGHLIGHT': {
+            const { options, highlightedIndex } = state.autocomplete;
+            if (options.length === 0) return state;
+            const nextIndex =
+                action.step > 0
+                    ? highlightedIndex < options.length - 1
+                        ? highlightedIndex + 1
+                        : 0
+                    : highlightedIndex > 0
+                      ? highlightedIndex - 1
+                      : options.length - 1;
+            return {
+                ...state,
+                autocomplete: {
+                    ...state.autocomplete,
+                    highlightedIndex: nextIndex,
+                },
+            };
         }
-    } else {
-        // Multi-colored
-        return '#F4E164'; // Gold
+        default:
+            return state;
     }
 }
 
+// Shared fallback so a card without options doesn't allocate a new array every render
+const NO_CHOICES: React.ComponentProps<typeof MultipleChoiceInput>['options'] = [];
 
 // Memoized version of MultipleChoiceInput to prevent unnecessary re-renders
 const MemoizedMultipleChoiceInput = React.memo(MultipleChoiceInput, (prevProps, nextProps) => {
@@ -69,36 +343,35 @@ const MemoizedMultipleChoiceInput = React.memo(MultipleChoiceInput, (prevProps,
     );
 });
 
+// Memoized subcomponents - props are primitives or state-held arrays, so shallow equality holds
+const MemoizedAutocompleteDropdown = React.memo(AutocompleteDropdown);
+const MemoizedScoreHeader = React.memo(ScoreHeader);
+
 export default function CardGuessingGame({
     selectedSets,
     inputMode,
     onBackToSetup,
 }: CardGuessingGameProps) {
-    // Game state (will be restored from localStorage)
-    const [gameState, setGameState] = useState<GameState>({
-        currentCard: null,
-        isLoading: false,
-        isGuessSubmitted: false,
-        lastGuess: '',
-        isCorrectGuess: null,
-        score: 0,
-        streak: 0,
-        totalGuesses: 0,
-        inputMode: inputMode,
-        multipleChoiceOptions: [],
-        selectedChoice: null,
-    });
+    // Game state (will be restored from localStorage) and autocomplete dropdown state (ephemeral)
+    const [{ game: gameState, autocomplete }, dispatch] = useReducer(
+        gameReducer,
+        inputMode,
+        createInitialState
+    );
+    const {
+        options: autocompleteOptions,
+        isOpen: showAutocomplete,
+        highlightedIndex,
+    } = autocomplete;
 
     // Input state (will be restored from localStorage)
     const [guessInput, setGuessInput] = useState('');
 
-    // Autocomplete state (not persisted - ephemeral)
-    const [autocompleteOptions, setAutocompleteOptions] = useState<string[]>(
-        []
-    );
-    const [showAutocomplete, setShowAutocomplete] = useState(false);
+    // Lower-priority copy of the input that drives autocomplete, so typing never waits on the dropdown
+    const deferredGuess = useDeferredValue(guessInput);
+
+    // Autocomplete loading indicator (not persisted - ephemeral)
     const [isLoadingAutocomplete, setIsLoadingAutocomplete] = useState(false);
-    const [highlightedIndex, setHighlightedIndex] = useState<number>(-1);
 
     // Multiple choice state
     const [selectedChoice, setSelectedChoice] = useState<string | null>(null);
@@ -106,12 +379,24 @@ export default function CardGuessingGame({
     // State restoration tracking
     const [isStateRestored, setIsStateRestored] = useState(false);
 
+    // Id of the card whose image has finished loading (placeholder shown until it matches)
+    const [loadedImageCardId, setLoadedImageCardId] = useState<string | null>(
+        null
+    );
+
+    // Suggestion cache for this game - lazy initializer so the Map is only built once
+    const [autocompleteCache] = useState(() => new Map<string, string[]>());
+
     // Refs
     const inputRef = useRef<HTMLInputElement>(null);
+    const prefetchedCardRef = useRef<Promise<ScryfallCard | null> | null>(
+        null
+    );
+    const lastAutocompleteKeystrokeRef = useRef(0);
 
     // Update game state when inputMode prop changes
     useEffect(() => {
-        setGameState((prev) => ({ ...prev, inputMode }));
+        dispatch({ type: 'SET_INPUT_MODE', inputMode });
     }, [inputMode]);
 
     // Regenerate multiple choice options when switching to multiple choice mode
@@ -136,10 +421,10 @@ export default function CardGuessingGame({
                         gameState.currentCard,
                         selectedSets
                     );
-                    setGameState((prev) => ({
-                        ...prev,
+                    dispatch({
+                        type: 'SET_CHOICES',
                         multipleChoiceOptions: options,
-                    }));
+                    });
                     console.log(
                         'Successfully regenerated multiple choice options:',
                         options
@@ -156,10 +441,10 @@ export default function CardGuessingGame({
                         { text: 'Counterspell', isCorrect: false },
                         { text: 'Giant Growth', isCorrect: false }
                     ];
-                    setGameState((prev) => ({
-                        ...prev,
+                    dispatch({
+                        type: 'SET_CHOICES',
                         multipleChoiceOptions: fallbackOptions,
-                    }));
+                    });
                 }
             }
         };
@@ -178,19 +463,22 @@ export default function CardGuessingGame({
             const persistedState = loadGameState();
 
             // Restore game progress
-            setGameState({
-                currentCard: persistedState.currentCard,
-                isLoading: false,
-                isGuessSubmitted: persistedState.isGuessSubmitted,
-                lastGuess: persistedState.lastGuess,
-                isCorrectGuess: persistedState.isCorrectGuess,
-                score: persistedState.score,
-                streak: persistedState.streak,
-                totalGuesses: persistedState.totalGuesses,
-                inputMode: inputMode, // Use current prop
-                multipleChoiceOptions:
-                    persistedState.multipleChoiceOptions || [],
-                selectedChoice: persistedState.selectedChoice || null,
+            dispatch({
+                type: 'RESTORE',
+                game: {
+                    currentCard: persistedState.currentCard,
+                    isLoading: false,
+                    isGuessSubmitted: persistedState.isGuessSubmitted,
+                    lastGuess: persistedState.lastGuess,
+                    isCorrectGuess: persistedState.isCorrectGuess,
+                    score: persistedState.score,
+                    streak: persistedState.streak,
+                    totalGuesses: persistedState.totalGuesses,
+                    inputMode: inputMode, // Use current prop
+                    multipleChoiceOptions:
+                        persistedState.multipleChoiceOptions || [],
+                    selectedChoice: persistedState.selectedChoice || null,
+                },
             });
 
             // Restore input state
@@ -244,57 +532,159 @@ export default function CardGuessingGame({
         }
     }, [gameState.currentCard, gameState.isGuessSubmitted, inputMode]);
 
-    // Reset highlighted index when autocomplete options change
-    useEffect(() => {
-        setHighlightedIndex(-1);
-    }, [autocompleteOptions]);
-
-    // Autocomplete functionality - immediate response (no debounce)
+    // Autocomplete functionality - leading-edge fetch with a trailing fetch per typing burst
     useEffect(() => {
         // Only run autocomplete for autocomplete mode
         if (inputMode !== 'autocomplete') {
-            setShowAutocomplete(false);
-            setAutocompleteOptions([]);
-            setHighlightedIndex(-1);
+            dispatch({ type: 'CLEAR_SUGGESTIONS' });
+            setIsLoadingAutocomplete(false);
             return;
         }
 
         // Don't show autocomplete if guess is submitted or input is empty
-        if (gameState.isGuessSubmitted || guessInput.length < 2) {
-            setShowAutocomplete(false);
-            setAutocompleteOptions([]);
-            setHighlightedIndex(-1);
+        if (gameState.isGuessSubmitted || deferredGuess.length < 2) {
+            dispatch({ type: 'CLEAR_SUGGESTIONS' });
+            setIsLoadingAutocomplete(false);
+            return;
+        }
+
+        // Serve from the prefix cache when possible - no request or spinner needed
+        const query = deferredGuess.toLowerCase();
+        const cachedSuggestions = getCachedSuggestions(
+            autocompleteCache,
+            query
+        );
+        if (cachedSuggestions) {
+            startTransition(() => {
+                dispatch({
+                    type: 'SHOW_SUGGESTIONS',
+                    options: cachedSuggestions.slice(0, AUTOCOMPLETE_LIMIT),
+                });
+            });
+            setIsLoadingAutocomplete(false);
             return;
         }
 
-        // Make autocomplete request immediately
+        // One controller per input - the cleanup below aborts it once the input changes
+        const controller = new AbortController();
+
+        // Make autocomplete request
         const fetchAutocomplete = async () => {
             try {
                 setIsLoadingAutocomplete(true);
                 const suggestions = await getCardNameAutocompleteFromSets(
-                    guessInput,
-                    selectedSets
+                    deferredGuess,
+                    selectedSets,
+                    { signal: controller.signal }
+                );
+                // Set-specific lookups can resolve without fetching, so check again
+                if (controller.signal.aborted) return;
+                // A failed lookup is not "no matches" - don't cache it, or every longer
+                // query would be answered as empty from this prefix
+                if (suggestions === null) {
+                    dispatch({ type: 'CLEAR_SUGGESTIONS' });
+                    return;
+                }
+                cacheSuggestions(
+                    autocompleteCache,
+                    query,
+                    suggestions
                 );
-                setAutocompleteOptions(suggestions.slice(0, 8)); // Limit to 8 suggestions
-                setShowAutocomplete(suggestions.length > 0);
+                // Low priority so rendering the list never delays echoing keystrokes
+                startTransition(() => {
+                    dispatch({
+                        type: 'SHOW_SUGGESTIONS',
+                        options: suggestions.slice(0, AUTOCOMPLETE_LIMIT),
+                    });
+                });
             } catch (error) {
+                // Superseded by a newer keystroke - keep the current dropdown
+                if (isAbortError(error)) return;
                 console.error('Autocomplete error:', error);
-                setAutocompleteOptions([]);
-                setShowAutocomplete(false);
+                dispatch({ type: 'CLEAR_SUGGESTIONS' });
             } finally {
-                setIsLoadingAutocomplete(false);
+                // A newer run owns the spinner once this one is aborted
+                if (!controller.signal.aborted) {
+                    setIsLoadingAutocomplete(false);
+                }
             }
         };
 
-        fetchAutocomplete();
-    }, [guessInput, gameState.isGuessSubmitted, inputMode]);
+        // A keystroke after a pause starts a burst and fetches in the next idle slot;
+        // later keystrokes push back a single trailing fetch until typing pauses, so a
+        // burst costs one leading and one trailing request
+        const now = Date.now();
+        const startsBurst =
+            now - lastAutocompleteKeystrokeRef.current >
+            AUTOCOMPLETE_BURST_WINDOW;
+        lastAutocompleteKeystrokeRef.current = now;
+
+        let cancelScheduledFetch: () => void;
+        if (startsBurst) {
+            cancelScheduledFetch = scheduleIdle(
+                fetchAutocomplete,
+                AUTOCOMPLETE_IDLE_TIMEOUT
+            );
+        } else {
+            const trailingTimeout = window.setTimeout(
+                fetchAutocomplete,
+                AUTOCOMPLETE_BURST_WINDOW
+            );
+            cancelScheduledFetch = () => window.clearTimeout(trailingTimeout);
+        }
+
+        return () => {
+            cancelScheduledFetch();
+            controller.abort();
+        };
+    }, [deferredGuess, gameState.isGuessSubmitted, inputMode]);
+
+    // Normalized answer, computed once per card so each guess only normalizes the input
+    const currentCardNameKey = useMemo(
+        () =>
+            gameState.currentCard
+                ? normalizeCardName(gameState.currentCard.name)
+                : '',
+        [gameState.currentCard?.id]
+    );
 
-    const loadNewCard = async () => {
-        try {
-            setGameState((prev) => ({ ...prev, isLoading: true }));
+    // Drop any prefetched card that came from a different set selection
+    useEffect(() => {
+        prefetchedCardRef.current = null;
+    }, [selectedSets]);
 
-            // Use multiple sets for card selection
+    // Fetch the next card (and warm its image in the browser cache); resolves to null on failure
+    const prefetchNextCard = useCallback(async () => {
+        try {
             const card = await getRandomCardFromSets(selectedSets);
+            preloadCardImage(card);
+            return card;
+        } catch (error) {
+            console.warn('Failed to prefetch next card:', error);
+            return null;
+        }
+    }, [selectedSets]);
+
+    // Start on the next card while the player reads the result of this one
+    useEffect(() => {
+        if (gameState.isGuessSubmitted && !prefetchedCardRef.current) {
+            prefetchedCardRef.current = prefetchNextCard();
+        }
+    }, [gameState.isGuessSubmitted, prefetchNextCard]);
+
+    const loadNewCard = useCallback(async () => {
+        try {
+            dispatch({ type: 'LOAD_START' });
+
+            // Use the prefetched card (waiting for it if still in flight), otherwise pick from the selected sets
+            const prefetchedCard = prefetchedCardRef.current;
+            prefetchedCardRef.current = null;
+            const card =
+                (await prefetchedCard) ??
+                (await getRandomCardFromSets(selectedSets));
+
+            // Start the image download now so it overlaps option generation and the render
+            preloadCardImage(card);
 
             // Generate multiple choice options if in multiple choice mode
             let multipleChoiceOptions: { text: string; isCorrect: boolean }[] = [];
@@ -319,34 +709,19 @@ export default function CardGuessingGame({
                 }
             }
 
-            setGameState((prev) => ({
-                ...prev,
-                currentCard: card,
-                isLoading: false,
-                isGuessSubmitted: false,
-                lastGuess: '',
-                isCorrectGuess: null,
-                multipleChoiceOptions,
-                selectedChoice: null,
-            }));
+            // Shows the card and clears the previous card's suggestions in one update
+            dispatch({ type: 'LOAD_OK', card, multipleChoiceOptions });
 
             // Reset input states
             setGuessInput('');
             setSelectedChoice(null);
-            setShowAutocomplete(false);
-            setAutocompleteOptions([]);
-            setHighlightedIndex(-1);
         } catch (error) {
             console.error('Error loading card:', error);
-            setGameState((prev) => ({
-                ...prev,
-                isLoading: false,
-                currentCard: null,
-            }));
+            dispatch({ type: 'LOAD_FAIL' });
         }
-    };
+    }, [selectedSets, inputMode]);
 
-    const submitGuess = () => {
+    const submitGuess = useCallback(() => {
         if (!gameState.currentCard) return;
 
         let guessToCheck = '';
@@ -362,71 +737,46 @@ export default function CardGuessingGame({
             displayGuess = guessInput;
         }
 
-        const isCorrect = cardNamesMatch(
-            guessToCheck,
-            gameState.currentCard.name
-        );
+        const isCorrect =
+            normalizeCardName(guessToCheck) === currentCardNameKey;
 
-        setGameState((prev) => ({
-            ...prev,
-            isGuessSubmitted: true,
-            lastGuess: displayGuess,
-            isCorrectGuess: isCorrect,
-            score: isCorrect ? prev.score + 1 : prev.score,
-            streak: isCorrect ? prev.streak + 1 : 0,
-            totalGuesses: prev.totalGuesses + 1,
+        dispatch({
+            type: 'SUBMIT',
+            guess: displayGuess,
+            isCorrect,
             selectedChoice:
                 inputMode === 'multiplechoice' ? selectedChoice : null,
-        }));
-
-        setShowAutocomplete(false);
-        setHighlightedIndex(-1);
-    };
+        });
+    }, [
+        gameState.currentCard,
+        currentCardNameKey,
+        inputMode,
+        selectedChoice,
+        guessInput,
+    ]);
 
-    const skipCard = () => {
+    const skipCard = useCallback(() => {
         if (!gameState.currentCard) return;
 
-        setGameState((prev) => ({
-            ...prev,
-            isGuessSubmitted: true,
-            lastGuess: '',
-            isCorrectGuess: false,
-            streak: 0,
-            totalGuesses: prev.totalGuesses + 1,
-            selectedChoice: null,
-        }));
-
-        setShowAutocomplete(false);
-        setHighlightedIndex(-1);
+        dispatch({ type: 'SKIP' });
         setSelectedChoice(null);
-    };
+    }, [gameState.currentCard]);
 
-    const nextCard = () => {
+    const nextCard = useCallback(() => {
         loadNewCard();
-    };
+    }, [loadNewCard]);
 
-    const resetScores = () => {
+    const resetScores = useCallback(() => {
         resetGameScores();
-        setGameState((prev) => ({
-            ...prev,
-            score: 0,
-            streak: 0,
-            totalGuesses: 0,
-            currentCard: null,
-            isGuessSubmitted: false,
-            lastGuess: '',
-            isCorrectGuess: null,
-            multipleChoiceOptions: [],
-            selectedChoice: null,
-        }));
+        dispatch({ type: 'RESET_SCORES' });
         setGuessInput('');
         setSelectedChoice(null);
         loadNewCard();
-    };
+    }, [loadNewCard]);
 
-    const handleInputChange = (value: string) => {
+    const handleInputChange = useCallback((value: string) => {
         setGuessInput(value);
-    };
+    }, []);
 
     const handleChoiceSelect = useCallback((choice: string) => {
         // Set the selected choice and immediately submit
@@ -435,24 +785,25 @@ export default function CardGuessingGame({
         // Auto-submit the guess
         if (!gameState.currentCard) return;
 
-        const isCorrect = cardNamesMatch(choice, gameState.currentCard.name);
+        const isCorrect = normalizeCardName(choice) === currentCardNameKey;
 
-        setGameState((prev) => ({
-            ...prev,
-            isGuessSubmitted: true,
-            lastGuess: choice,
-            isCorrectGuess: isCorrect,
-            score: isCorrect ? prev.score + 1 : prev.score,
-            streak: isCorrect ? prev.streak + 1 : 0,
-            totalGuesses: prev.totalGuesses + 1,
+        dispatch({
+            type: 'SUBMIT',
+            guess: choice,
+            isCorrect,
             selectedChoice: choice,
-        }));
+        });
+    }, [gameState.currentCard, currentCardNameKey]);
 
-        setShowAutocomplete(false);
-        setHighlightedIndex(-1);
-    }, [gameState.currentCard]);
+    const selectAutocompleteOption = useCallback((option: string) => {
+        setGuessInput(option);
+        dispatch({ type: 'CLOSE_SUGGESTIONS' });
+        if (inputRef.current && !isMobileDevice()) {
+            inputRef.current.focus();
+        }
+    }, []);
 
-    const handleKeyDown = (event: React.KeyboardEvent) => {
+    const handleKeyDown = useCallback((event: React.KeyboardEvent) => {
         // Only handle keyboard events for autocomplete mode
         if (inputMode !== 'autocomplete') return;
 
@@ -460,17 +811,13 @@ export default function CardGuessingGame({
         if (showAutocomplete && autocompleteOptions.length > 0) {
             if (event.key === 'ArrowDown') {
                 event.preventDefault();
-                setHighlightedIndex((prev) =>
-                    prev < autocompleteOptions.length - 1 ? prev + 1 : 0
-                );
+                dispatch({ type: 'MOVE_HIGHLIGHT', step: 1 });
                 return;
             }
 
             if (event.key === 'ArrowUp') {
                 event.preventDefault();
-                setHighlightedIndex((prev) =>
-                    prev > 0 ? prev - 1 : autocompleteOptions.length - 1
-                );
+                dispatch({ type: 'MOVE_HIGHLIGHT', step: -1 });
                 return;
             }
 
@@ -481,27 +828,46 @@ export default function CardGuessingGame({
             }
         }
 
-        // Handle normal game actions
-        if (event.key === 'Enter') {
-            if (gameState.isGuessSubmitted) {
+        // Enter submits through the form's onSubmit
+        if (event.key === 'Escape') {
+            dispatch({ type: 'CLOSE_SUGGESTIONS' });
+        }
+    }, [
+        inputMode,
+        showAutocomplete,
+        autocompleteOptions,
+        highlightedIndex,
+        selectAutocompleteOption,
+    ]);
+
+    const handleGuessFormSubmit = useCallback(
+        (event: React.FormEvent) => {
+            event.preventDefault();
+            submitGuess();
+        },
+        [submitGuess]
+    );
+
+    // The guess input is unmounted after submitting, so listen on the window for Enter
+    // Detached while a card loads, so repeated presses can't start overlapping loads
+    useEffect(() => {
+        if (!gameState.isGuessSubmitted || gameState.isLoading) return;
+
+        const handleWindowKeyDown = (event: KeyboardEvent) => {
+            // Ignore auto-repeat so a held Enter from submitting doesn't skip the result;
+            // a focused button already turns Enter into a click
+            if (
+                event.key === 'Enter' &&
+                !event.repeat &&
+                !(event.target instanceof HTMLButtonElement)
+            ) {
                 nextCard();
-            } else {
-                submitGuess();
             }
-        } else if (event.key === 'Escape') {
-            setShowAutocomplete(false);
-            setHighlightedIndex(-1);
-        }
-    };
+        };
 
-    const selectAutocompleteOption = (option: string) => {
-        setGuessInput(option);
-        setShowAutocomplete(false);
-        setHighlightedIndex(-1);
-        if (inputRef.current && !isMobileDevice()) {
-            inputRef.current.focus();
-        }
-    };
+        window.addEventListener('keydown', handleWindowKeyDown);
+        return () => window.removeEventListener('keydown', handleWindowKeyDown);
+    }, [gameState.isGuessSubmitted, gameState.isLoading, nextCard]);
 
     // Calculate accuracy percentage
     const accuracy =
@@ -509,6 +875,19 @@ export default function CardGuessingGame({
             ? Math.round((gameState.score / gameState.totalGuesses) * 100)
             : 0;
 
+    // Overlay colour only changes with the color identity, not on every keystroke
+    // or between cards of the same colors (no card counts as colorless)
+    const colorIdentity = gameState.currentCard?.color_identity?.join('') ?? '';
+    const overlayColor = useMemo(
+        () => getCardFrameColor(colorIdentity),
+        [colorIdentity]
+    );
+    // Geometry, border and shadow live in the static .name-overlay class
+    const overlayStyle = useMemo<React.CSSProperties>(
+        () => ({ backgroundColor: overlayColor }),
+        [overlayColor]
+    );
+
     // Show loading while restoring state
     if (!isStateRestored) {
         return (
@@ -567,6 +946,9 @@ export default function CardGuessingGame({
         );
     }
 
+    const currentCardId = gameState.currentCard.id;
+    const isImageLoaded = loadedImageCardId === currentCardId;
+
     return (
         <div className='min-h-screen bg-gray-100'>
             <div className='container mx-auto px-4 py-8 max-w-4xl'>
@@ -577,13 +959,16 @@ export default function CardGuessingGame({
                             {/* Render different inputs based on mode */}
                             {inputMode === 'multiplechoice' ? (
                                 <MemoizedMultipleChoiceInput
-                                    options={gameState.multipleChoiceOptions || []}
+                                    options={gameState.multipleChoiceOptions ?? NO_CHOICES}
                                     onChoiceSelect={handleChoiceSelect}
                                     isCorrect={gameState.isCorrectGuess}
                                     correctAnswer={gameState.currentCard.name}
                                 />
                             ) : (
-                                <>
+                                <form
+                                    onSubmit={handleGuessFormSubmit}
+                                    className='space-y-4'
+                                >
                                     {/* Text Input (Autocomplete or Plain Text) */}
                                     <div className='relative'>
                                         <label
@@ -612,28 +997,11 @@ export default function CardGuessingGame({
                                         {inputMode === 'autocomplete' &&
                                             showAutocomplete &&
                                             autocompleteOptions.length > 0 && (
-                                                <div className='absolute z-10 w-full mt-1 bg-white border border-gray-300 rounded-lg shadow-lg max-h-60 overflow-y-auto'>
-                                                    {autocompleteOptions.map(
-                                                        (option, index) => (
-                                                            <button
-                                                                key={index}
-                                                                onClick={() =>
-                                                                    selectAutocompleteOption(
-                                                                        option
-                                                                    )
-                                                                }
-                                                                className={`w-full text-left px-4 py-2 focus:outline-none first:rounded-t-lg last:rounded-b-lg transition-colors ${
-                                                                    index ===
-                                                                    highlightedIndex
-                                                                        ? 'bg-blue-100 text-blue-900'
-                                                                        : 'hover:bg-blue-50'
-                                                                }`}
-                                                            >
-                                                                {option}
-                                                            </button>
-                                                        )
-                                                    )}
-                                                </div>
+                                                <MemoizedAutocompleteDropdown
+                                                    options={autocompleteOptions}
+                                                    highlightedIndex={highlightedIndex}
+                                                    onSelect={selectAutocompleteOption}
+                                                />
                                             )}
 
                                         {/* Loading indicator for autocomplete */}
@@ -658,20 +1026,21 @@ export default function CardGuessingGame({
                                     {/* Action Buttons - Mobile Optimized */}
                                     <div className='flex flex-row gap-3'>
                                         <button
-                                            onClick={submitGuess}
+                                            type='submit'
                                             disabled={!guessInput.trim()}
                                             className='flex-1 bg-green-600 text-white py-2 px-3 sm:py-3 sm:px-6 rounded-lg text-sm sm:text-base font-medium hover:bg-green-700 disabled:bg-gray-300 disabled:cursor-not-allowed transition-colors'
                                         >
                                             Submit Guess
                                         </button>
                                         <button
+                                            type='button'
                                             onClick={skipCard}
                                             className='flex-1 bg-yellow-600 text-white py-2 px-3 sm:py-3 sm:px-6 rounded-lg text-sm sm:text-base font-medium hover:bg-yellow-700 transition-colors'
                                         >
                                             Skip Card
                                         </button>
                                     </div>
-                                </>
+                                </form>
                             )}
                         </div>
                     ) : (
@@ -698,7 +1067,13 @@ export default function CardGuessingGame({
 
                         {/* Card Image with Name Overlay */}
                         <div className='flex justify-center mb-4 sm:mb-6'>
-                            <div className='relative inline-block'>
+                            <div
+                                className={`relative inline-block rounded-lg ${
+                                    isImageLoaded
+                                        ? ''
+                                        : 'bg-gray-200 animate-pulse'
+                                }`}
+                            >
                                 <img
                                     src={getCardImageUrl(
                                         gameState.currentCard,
@@ -706,34 +1081,31 @@ export default function CardGuessingGame({
                                     )}
                                     alt='Magic card with hidden name'
                                     className='rounded-lg shadow-lg'
+                                    decoding='async'
+                                    fetchPriority='high'
+                                    onLoad={() =>
+                                        setLoadedImageCardId(currentCardId)
+                                    }
+                                    // A failed image still settles the slot so the alt text shows
+                                    onError={() =>
+                                        setLoadedImageCardId(currentCardId)
+                                    }
                                     style={{
                                         maxHeight: '500px',
                                         width: 'auto',
                                         height: 'auto',
+                                        // Card proportions reserve space while the image loads
+                                        aspectRatio: '488 / 680',
+                                        opacity: isImageLoaded ? 1 : 0,
+                                        transition: 'opacity 120ms',
                                     }}
                                 />
 
                                 {/* Name Overlay - Only show when guess NOT submitted */}
-                                {!gameState.isGuessSubmitted && (
+                                {!gameState.isGuessSubmitted && isImageLoaded && (
                                     <div
-                                        className='absolute'
-                                        style={{
-                                            // Positioning to fully cover name text
-                                            top: '5.5%', // Same top position
-                                            left: '7%', // Same left margin
-                                            right: '25%', // Same length
-                                            height: '4.2%', // Current working height
-                                            backgroundColor: getCardFrameColor(
-                                                gameState.currentCard
-                                            ),
-                                            // Completely opaque with subtle border
-                                            opacity: '1', // Full opacity - no transparency
-                                            border: '1px solid rgba(0,0,0,0.15)',
-                                            borderRadius: '2px',
-                                            // Subtle shadow to blend with card
-                                            boxShadow:
-                                                'inset 0 1px 1px rgba(0,0,0,0.1)',
-                                        }}
+                                        className='name-overlay'
+                                        style={overlayStyle}
                                     />
                                 )}
                             </div>
@@ -797,41 +1169,12 @@ export default function CardGuessingGame({
                     <div className='flex flex-col lg:flex-row lg:items-center lg:justify-between gap-6'>
                         {/* Score Display */}
                         <div className='flex justify-center lg:justify-start'>
-                            <div className='flex items-center space-x-8 text-center'>
-                                <div className='flex flex-col items-center'>
-                                    <div className='text-2xl font-bold text-green-600'>
-                                        {gameState.score}
-                                    </div>
-                                    <div className='text-sm text-gray-600'>
-                                        Correct
-                                    </div>
-                                </div>
-                                <div className='flex flex-col items-center'>
-                                    <div className='text-2xl font-bold text-red-600'>
-                                        {gameState.totalGuesses -
-                                            gameState.score}
-                                    </div>
-                                    <div className='text-sm text-gray-600'>
-                                        Incorrect
-                                    </div>
-                                </div>
-                                <div className='flex flex-col items-center'>
-                                    <div className='text-2xl font-bold text-blue-600'>
-                                        {gameState.streak}
-                                    </div>
-                                    <div className='text-sm text-gray-600'>
-                                        Streak
-                                    </div>
-                                </div>
-                                <div className='flex flex-col items-center'>
-                                    <div className='text-2xl font-bold text-gray-600'>
-                                        {accuracy}%
-                                    </div>
-                                    <div className='text-sm text-gray-600'>
-                                        Accuracy
-                                    </div>
-                                </div>
-                            </div>
+                            <MemoizedScoreHeader
+                                score={gameState.score}
+                                totalGuesses={gameState.totalGuesses}
+                                streak={gameState.streak}
+                                accuracy={accuracy}
+                            />
                         </div>
 
                         {/* Action Buttons - Inside Same Panel */}
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo } from 'react';
 import { fetchSets, searchCardsMultipleSets } from '../services/scryfall';
 import type { ScryfallSet, ScryfallSearchResponse } from '../types';
 import InputModeSelector from './InputModeSelector';
@@ -94,8 +94,15 @@ export default function FilterDropdowns({
     }
   };
 
+  // Lookup tables so per-row membership checks are O(1) instead of array scans
+  const selectedSetCodes = useMemo(() => new Set(selectedSets), [selectedSets]);
+  const setsByCode = useMemo(
+    () => new Map(sets.map(set => [set.code, set])),
+    [sets]
+  );
+
   const handleSetSelect = (setCode: string) => {
-    const isCurrentlySelected = selectedSets.includes(setCode);
+    const isCurrentlySelected = selectedSetCodes.has(setCode);
     
     if (isCurrentlySelected) {
       // Remove set - keep dropdown open for easy multi-deselect
@@ -121,11 +128,14 @@ export default function FilterDropdowns({
   };
 
   // Filter sets based on search input and exclude sets with 0 cards
-  const filteredSets = sets.filter(set =>
-    (set.name.toLowerCase().includes(searchInput.toLowerCase()) ||
-     set.code.toLowerCase().includes(searchInput.toLowerCase())) &&
-    set.card_count > 0
-  );
+  const filteredSets = useMemo(() => {
+    const searchLower = searchInput.toLowerCase();
+    return sets.filter(set =>
+      (set.name.toLowerCase().includes(searchLower) ||
+       set.code.toLowerCase().includes(searchLower)) &&
+      set.card_count > 0
+    );
+  }, [sets, searchInput]);
 
   return (
     <div className="bg-white rounded-lg shadow-lg p-6">
@@ -177,7 +187,7 @@ export default function FilterDropdowns({
             <div className="absolute z-10 w-full mt-1 bg-white border border-gray-300 rounded-lg shadow-lg max-h-64 overflow-y-auto">
               {filteredSets.length > 0 ? (
                 filteredSets.map((set, index) => {
-                  const isSelected = selectedSets.includes(set.code);
+                  const isSelected = selectedSetCodes.has(set.code);
                   return (
                     <button
                       key={set.code}
@@ -214,7 +224,7 @@ export default function FilterDropdowns({
             <div className="flex flex-wrap items-center gap-2 mb-3">
               <span className="text-sm font-medium text-blue-800">Selected Sets:</span>
               {selectedSets.map(setCode => {
-                const set = sets.find(s => s.code === setCode);
+                const set = setsByCode.get(setCode);
                 return (
                   <div
                     key={setCode}
@@ -0,0 +1,52 @@
+import React from 'react';
+
+interface ScoreHeaderProps {
+  score: number;
+  totalGuesses: number;
+  streak: number;
+  accuracy: number;
+}
+
+export default function ScoreHeader({
+  score,
+  totalGuesses,
+  streak,
+  accuracy
+}: ScoreHeaderProps) {
+  return (
+    <div className="flex items-center space-x-8 text-center">
+      <div className="flex flex-col items-center">
+        <div className="text-2xl font-bold text-green-600">
+          {score}
+        </div>
+        <div className="text-sm text-gray-600">
+          Correct
+        </div>
+      </div>
+      <div className="flex flex-col items-center">
+        <div className="text-2xl font-bold text-red-600">
+          {totalGuesses - score}
+        </div>
+        <div className="text-sm text-gray-600">
+          Incorrect
+        </div>
+      </div>
+      <div className="flex flex-col items-center">
+        <div className="text-2xl font-bold text-blue-600">
+          {streak}
+        </div>
+        <div className="text-sm text-gray-600">
+          Streak
+        </div>
+      </div>
+      <div className="flex flex-col items-center">
+        <div className="text-2xl font-bold text-gray-600">
+          {accuracy}%
+        </div>
+        <div className="text-sm text-gray-600">
+          Accuracy
+        </div>
+      </div>
+    </div>
+  );
+}
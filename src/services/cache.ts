@@ -0,0 +1,307 @@
+// Response Cache Service
+// Persists Scryfall data in IndexedDB so cached objects are stored via structured clone
+// instead of a JSON round-trip; falls back to localStorage when IndexedDB is unavailable
+
+// =============================================================================
+// CACHE CONFIGURATION
+// =============================================================================
+
+const DB_NAME = 'mtg-quiz-app-cache';
+const DB_VERSION = 2;
+const STORE_NAME = 'responses';
+const META_STORE_NAME = 'entry-meta';
+const FALLBACK_KEY_PREFIX = 'mtg-quiz-app-cache:';
+const FALLBACK_META_KEY_PREFIX = 'mtg-quiz-app-cache-meta:';
+const TOUCH_INTERVAL = 10 * 60 * 1000; // Minimum time between lastUsedAt updates per entry
+
+interface CacheEntry<T> {
+  value: T;
+  storedAt: number;
+}
+
+// Small per-entry record kept beside entries that cacheTrim manages, so reads can
+// record use and trims can pick victims without loading or rewriting the values
+interface CacheEntryMeta {
+  storedAt: number; // Write time - drives maxAgeMs expiry
+  lastUsedAt: number; // Last read or write - drives least-recently-used trimming
+  size: number; // Approximate size in bytes for byte budgets
+}
+
+export interface CacheTrimLimits {
+  maxEntries: number;
+  maxBytes: number;
+  maxAgeMs: number;
+}
+
+// Last-use times already persisted this session, so repeated hits don't rewrite metadata
+const persistedTouches = new Map<string, number>();
+
+// =============================================================================
+// INDEXEDDB HELPERS
+// =============================================================================
+
+let databasePromise: Promise<IDBDatabase | null> | null = null;
+
+/**
+ * Open (once) the cache database, resolving to null if IndexedDB can't be used
+ */
+function openDatabase(): Promise<IDBDatabase | null> {
+  if (!databasePromise) {
+    databasePromise = new Promise(resolve => {
+      if (typeof indexedDB === 'undefined') {
+        resolve(null);
+        return;
+      }
+
+      try {
+        const request = indexedDB.open(DB_NAME, DB_VERSION);
+        request.onupgradeneeded = () => {
+          const db = request.result;
+          if (!db.objectStoreNames.contains(STORE_NAME)) {
+            db.createObjectStore(STORE_NAME);
+          }
+          if (!db.objectStoreNames.contains(META_STORE_NAME)) {
+            db.createObjectStore(META_STORE_NAME);
+          }
+        };
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => {
+          console.warn('IndexedDB is not available, using localStorage cache:', request.error);
+          resolve(null);
+        };
+      } catch (error) {
+        console.warn('IndexedDB is not available, using localStorage cache:', error);
+        resolve(null);
+      }
+    });
+  }
+  return databasePromise;
+}
+
+/**
+ * Run a single request against one of the cache object stores
+ */
+function runStoreRequest<R>(
+  db: IDBDatabase,
+  storeName: string,
+  mode: IDBTransactionMode,
+  operation: (store: IDBObjectStore) => IDBRequest<R>
+): Promise<R> {
+  return new Promise((resolve, reject) => {
+    const request = operation(db.transaction(storeName, mode).objectStore(storeName));
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+/**
+ * Run several writes against both stores in one transaction
+ */
+function runWriteTransaction(
+  db: IDBDatabase,
+  operation: (entries: IDBObjectStore, meta: IDBObjectStore) => void
+): Promise<void> {
+  return new Promise((resolve, reject) => {
+    const transaction = db.transaction([STORE_NAME, META_STORE_NAME], 'readwrite');
+    operation(transaction.objectStore(STORE_NAME), transaction.objectStore(META_STORE_NAME));
+    transaction.oncomplete = () => resolve();
+    transaction.onerror = () => reject(transaction.error);
+    transaction.onabort = () => reject(transaction.error);
+  });
+}
+
+/**
+ * Delete entries and their metadata by key
+ */
+async function deleteEntries(db: IDBDatabase | null, keys: string[]): Promise<void> {
+  if (db) {
+    await runWriteTransaction(db, (entries, meta) => {
+      keys.forEach(key => {
+        entries.delete(key);
+        meta.delete(key);
+      });
+    });
+  } else {
+    keys.forEach(key => {
+      localStorage.removeItem(FALLBACK_KEY_PREFIX + key);
+      localStorage.removeItem(FALLBACK_META_KEY_PREFIX + key);
+    });
+  }
+}
+
+/**
+ * Record a cache hit in the entry's metadata, at most once per TOUCH_INTERVAL
+ * Entries without metadata aren't trimmed, so there is nothing to update for them
+ */
+async function touchEntry(db: IDBDatabase | null, key: string): Promise<void> {
+  const now = Date.now();
+  const lastTouch = persistedTouches.get(key);
+  if (lastTouch !== undefined && now - lastTouch < TOUCH_INTERVAL) {
+    return;
+  }
+  persistedTouches.set(key, now);
+
+  try {
+    if (db) {
+      await new Promise<void>((resolve, reject) => {
+        const transaction = db.transaction(META_STORE_NAME, 'readwrite');
+        const meta = transaction.objectStore(META_STORE_NAME);
+        const request = meta.get(key);
+        request.onsuccess = () => {
+          const entryMeta: CacheEntryMeta | undefined = request.result;
+          if (entryMeta) {
+            meta.put({ ...entryMeta, lastUsedAt: now }, key);
+          }
+        };
+        transaction.oncomplete = () => resolve();
+        transaction.onerror = () => reject(transaction.error);
+      });
+    } else {
+      const storedMeta = localStorage.getItem(FALLBACK_META_KEY_PREFIX + key);
+      if (storedMeta) {
+        const entryMeta: CacheEntryMeta = JSON.parse(storedMeta);
+        localStorage.setItem(
+          FALLBACK_META_KEY_PREFIX + key,
+          JSON.stringify({ ...entryMeta, lastUsedAt: now })
+        );
+      }
+    }
+  } catch (error) {
+    console.warn(`Failed to update cache metadata "${key}":`, error);
+  }
+}
+
+// =============================================================================
+// CACHE OPERATIONS
+// =============================================================================
+
+/**
+ * Read a cached value, returning null if it is missing or older than maxAgeMs
+ * Expired entries are deleted; hits are recorded for least-recently-used trimming
+ */
+export async function cacheGet<T>(key: string, maxAgeMs: number): Promise<T | null> {
+  try {
+    const db = await openDatabase();
+    let entry: CacheEntry<T> | undefined;
+
+    if (db) {
+      entry = await runStoreRequest<CacheEntry<T> | undefined>(db, STORE_NAME, 'readonly', store => store.get(key));
+    } else {
+      const storedData = localStorage.getItem(FALLBACK_KEY_PREFIX + key);
+      entry = storedData ? JSON.parse(storedData) : undefined;
+    }
+
+    if (!entry) {
+      return null;
+    }
+    if (Date.now() - entry.storedAt > maxAgeMs) {
+      void deleteEntries(db, [key]);
+      return null;
+    }
+
+    void touchEntry(db, key);
+    return entry.value;
+  } catch (error) {
+    console.warn(`Failed to read cache entry "${key}":`, error);
+    return null;
+  }
+}
+
+/**
+ * Store a value in the cache; failures are logged and otherwise ignored
+ * Pass sizeBytes (an estimate is fine) for entries that cacheTrim should manage
+ */
+export async function cacheSet<T>(key: string, value: T, sizeBytes?: number): Promise<void> {
+  const now = Date.now();
+  const entry: CacheEntry<T> = { value, storedAt: now };
+  const entryMeta: CacheEntryMeta | null =
+    sizeBytes === undefined ? null : { storedAt: now, lastUsedAt: now, size: sizeBytes };
+
+  try {
+    const db = await openDatabase();
+
+    if (db) {
+      await runWriteTransaction(db, (entries, meta) => {
+        entries.put(entry, key);
+        if (entryMeta) {
+          meta.put(entryMeta, key);
+        }
+      });
+    } else {
+      localStorage.setItem(FALLBACK_KEY_PREFIX + key, JSON.stringify(entry));
+      if (entryMeta) {
+        localStorage.setItem(FALLBACK_META_KEY_PREFIX + key, JSON.stringify(entryMeta));
+      }
+    }
+    persistedTouches.set(key, now);
+  } catch (error) {
+    console.warn(`Failed to write cache entry "${key}":`, error);
+  }
+}
+
+/**
+ * Trim entries whose key starts with keyPrefix: expired entries are deleted, then the
+ * least recently used ones until both the entry count and byte budget are met
+ * Only metadata is read, so trimming never loads the cached values
+ */
+export async function cacheTrim(keyPrefix: string, limits: CacheTrimLimits): Promise<void> {
+  try {
+    const db = await openDatabase();
+    const entries: { key: string; meta: CacheEntryMeta }[] = [];
+
+    if (db) {
+      await new Promise<void>((resolve, reject) => {
+        const range = IDBKeyRange.bound(keyPrefix, keyPrefix + '\uffff');
+        const request = db.transaction(META_STORE_NAME, 'readonly').objectStore(META_STORE_NAME).openCursor(range);
+        request.onsuccess = () => {
+          const cursor = request.result;
+          if (!cursor) {
+            resolve();
+            return;
+          }
+          entries.push({ key: String(cursor.key), meta: cursor.value as CacheEntryMeta });
+          cursor.continue();
+        };
+        request.onerror = () => reject(request.error);
+      });
+    } else {
+      for (let i = 0; i < localStorage.length; i++) {
+        const storageKey = localStorage.key(i);
+        if (storageKey && storageKey.startsWith(FALLBACK_META_KEY_PREFIX + keyPrefix)) {
+          entries.push({
+            key: storageKey.slice(FALLBACK_META_KEY_PREFIX.length),
+            meta: JSON.parse(localStorage.getItem(storageKey) || '{"storedAt":0,"lastUsedAt":0,"size":0}')
+          });
+        }
+      }
+    }
+
+    const now = Date.now();
+    const staleKeys: string[] = [];
+    let keptEntries = 0;
+    let keptBytes = 0;
+
+    // Most recently used first; keep entries until a limit is reached
+    entries
+      .sort((a, b) => b.meta.lastUsedAt - a.meta.lastUsedAt)
+      .forEach(({ key, meta }) => {
+        if (
+          now - meta.storedAt > limits.maxAgeMs ||
+          keptEntries >= limits.maxEntries ||
+          keptBytes + meta.size > limits.maxBytes
+        ) {
+          staleKeys.push(key);
+        } else {
+          keptEntries++;
+          keptBytes += meta.size;
+        }
+      });
+
+    if (staleKeys.length > 0) {
+      await deleteEntries(db, staleKeys);
+      staleKeys.forEach(key => persistedTouches.delete(key));
+    }
+  } catch (error) {
+    console.warn(`Failed to trim cache entries "${keyPrefix}*":`, error);
+  }
+}
@@ -10,6 +10,7 @@ import type {
   ScryfallError,
   ApiError
 } from '../types';
+import { cacheGet, cacheSet, cacheTrim } from './cache';
 
 // =============================================================================
 // CONFIGURATION
@@ -17,10 +18,33 @@ import type {
 
 const SCRYFALL_API_BASE = 'https://api.scryfall.com';
 const REQUEST_DELAY = 100; // 100ms delay between requests to respect rate limits
+const SETS_CACHE_KEY = 'sets';
+const SETS_CACHE_MAX_AGE = 24 * 60 * 60 * 1000; // Set list only changes on new releases
+const AUTOCOMPLETE_CACHE_PREFIX = 'autocomplete:';
+const SET_NAMES_CACHE_PREFIX = 'set-names:';
+const AUTOCOMPLETE_CACHE_MAX_AGE = 7 * 24 * 60 * 60 * 1000; // Card names rarely change within a week
+const AUTOCOMPLETE_CACHE_TRIM_INTERVAL = 25; // Writes between trims of old autocomplete entries
+
+// Persistent cache budgets - kept well under 5 MB in total, because the localStorage
+// fallback shares its quota with the saved game state
+const AUTOCOMPLETE_CACHE_LIMITS = {
+  maxEntries: 500,
+  maxBytes: 1024 * 1024,
+  maxAgeMs: AUTOCOMPLETE_CACHE_MAX_AGE
+};
+const SET_NAMES_CACHE_LIMITS = {
+  maxEntries: 20,
+  maxBytes: 2 * 1024 * 1024,
+  maxAgeMs: AUTOCOMPLETE_CACHE_MAX_AGE
+};
 
 // Simple request delay to avoid hitting rate limits
 const delay = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
 
+// Debug logging - only in dev builds; guard each call with `if (DEBUG)` so the
+// bundler drops the whole statement, arguments included, from production builds
+const DEBUG = import.meta.env.DEV;
+
 // =============================================================================
 // ERROR HANDLING
 // =============================================================================
@@ -46,17 +70,50 @@ class ScryfallApiError extends Error {
   }
 }
 
+/**
+ * Check whether an error comes from a request cancelled via AbortController
+ */
+export function isAbortError(error: unknown): boolean {
+  return error instanceof DOMException && error.name === 'AbortError';
+}
+
 // =============================================================================
 // HTTP CLIENT
 // =============================================================================
 
-async function makeRequest<T>(endpoint: string): Promise<T> {
+interface RequestOptions {
+  signal?: AbortSignal;
+}
+
+// In-flight requests keyed by endpoint, so concurrent identical calls share one fetch
+const inflightRequests = new Map<string, Promise<unknown>>();
+
+function makeRequest<T>(endpoint: string, options: RequestOptions = {}): Promise<T> {
+  // Cancellable requests are never shared - aborting one caller must not affect another
+  if (options.signal) {
+    return performRequest<T>(endpoint, options.signal);
+  }
+  
+  const pending = inflightRequests.get(endpoint);
+  if (pending) {
+    return pending as Promise<T>;
+  }
+  
+  const request = performRequest<T>(endpoint).finally(() => {
+    inflightRequests.delete(endpoint);
+  });
+  inflightRequests.set(endpoint, request);
+  return request;
+}
+
+async function performRequest<T>(endpoint: string, signal?: AbortSignal): Promise<T> {
   const url = `${SCRYFALL_API_BASE}${endpoint}`;
   
   try {
     await delay(REQUEST_DELAY);
+    signal?.throwIfAborted();
     
-    const response = await fetch(url);
+    const response = await fetch(url, { signal });
     const data = await response.json();
     
     if (!response.ok) {
@@ -72,7 +129,7 @@ async function makeRequest<T>(endpoint: string): Promise<T> {
     
     return data;
   } catch (error) {
-    if (error instanceof ScryfallApiError) {
+    if (error instanceof ScryfallApiError || isAbortError(error)) {
       throw error;
     }
     
@@ -94,6 +151,12 @@ async function makeRequest<T>(endpoint: string): Promise<T> {
  * Returns detailed information about each set including name, code, release date
  */
 export async function fetchSets(): Promise<ScryfallSet[]> {
+  const cachedSets = await cacheGet<ScryfallSet[]>(SETS_CACHE_KEY, SETS_CACHE_MAX_AGE);
+  if (cachedSets) {
+    if (DEBUG) console.log(`Loaded ${cachedSets.length} core/expansion sets from cache`);
+    return cachedSets;
+  }
+  
   try {
     const response = await makeRequest<ScryfallSetsResponse>('/sets');
     
@@ -106,8 +169,9 @@ export async function fetchSets(): Promise<ScryfallSet[]> {
         new Date(b.released_at).getTime() - new Date(a.released_at).getTime()
       );
     
-    console.log(`Filtered ${response.data.length} total sets down to ${filteredSets.length} core/expansion sets`);
+    if (DEBUG) console.log(`Filtered ${response.data.length} total sets down to ${filteredSets.length} core/expansion sets`);
     
+    void cacheSet(SETS_CACHE_KEY, filteredSets);
     return filteredSets;
   } catch (error) {
     console.error('Failed to fetch sets:', error);
@@ -138,6 +202,22 @@ function buildMultipleSetQuery(setCodes: string[]): string {
   return `(${setQueries.join(' OR ')})`;
 }
 
+// Encoded search queries keyed by set list - pagination re-uses the same query
+const encodedQueryCache = new Map<string, string>();
+
+/**
+ * Build and URI-encode the search query for a set list, reusing earlier results
+ */
+function getEncodedSetQuery(setCodes: string[]): string {
+  const key = setCodes.join(',');
+  let encodedQuery = encodedQueryCache.get(key);
+  if (encodedQuery === undefined) {
+    encodedQuery = encodeURIComponent(buildMultipleSetQuery(setCodes));
+    encodedQueryCache.set(key, encodedQuery);
+  }
+  return encodedQuery;
+}
+
 /**
  * Search for cards from multiple sets
  * @param setCodes - Array of set codes to search in
@@ -158,11 +238,10 @@ export async function searchCardsMultipleSets(
     };
   }
   
-  const query = buildMultipleSetQuery(setCodes);
-  const endpoint = `/cards/search?q=${encodeURIComponent(query)}&page=${page}`;
+  const endpoint = `/cards/search?q=${getEncodedSetQuery(setCodes)}&page=${page}`;
   
   try {
-    console.log(`Searching cards from ${setCodes.length} sets:`, setCodes);
+    if (DEBUG) console.log(`Searching cards from ${setCodes.length} sets:`, setCodes);
     return await makeRequest<ScryfallSearchResponse>(endpoint);
   } catch (error) {
     console.error('Failed to search cards from multiple sets:', error);
@@ -215,7 +294,7 @@ export async function getRandomCardFromSets(setCodes: string[]): Promise<Scryfal
     const randomIndex = Math.floor(Math.random() * randomPageResponse.data.length);
     const selectedCard = randomPageResponse.data[randomIndex];
     
-    console.log(`Selected random card: ${selectedCard.name} from ${selectedCard.set_name}`);
+    if (DEBUG) console.log(`Selected random card: ${selectedCard.name} from ${selectedCard.set_name}`);
     return selectedCard;
     
   } catch (error) {
@@ -242,36 +321,148 @@ export async function getRandomCard(
 // AUTOCOMPLETE OPERATIONS
 // =============================================================================
 
+let autocompleteWritesSinceTrim = 0;
+
+/**
+ * Approximate stored size of a name list in bytes (UTF-16), without serializing it
+ */
+function estimateNamesSize(names: string[]): number {
+  let size = 0;
+  for (const name of names) {
+    size += name.length * 2;
+  }
+  return size;
+}
+
+/**
+ * Persist an autocomplete response, trimming the oldest entries every so often
+ */
+async function storeAutocompleteResponse(key: string, names: string[]): Promise<void> {
+  await cacheSet(key, names, estimateNamesSize(names));
+  
+  autocompleteWritesSinceTrim++;
+  if (autocompleteWritesSinceTrim >= AUTOCOMPLETE_CACHE_TRIM_INTERVAL) {
+    autocompleteWritesSinceTrim = 0;
+    await cacheTrim(AUTOCOMPLETE_CACHE_PREFIX, AUTOCOMPLETE_CACHE_LIMITS);
+  }
+}
+
+/**
+ * Persist the card names for a set selection; these are large, so trim after every write
+ */
+async function storeSetNames(setKey: string, names: string[]): Promise<void> {
+  await cacheSet(SET_NAMES_CACHE_PREFIX + setKey, names, estimateNamesSize(names));
+  await cacheTrim(SET_NAMES_CACHE_PREFIX, SET_NAMES_CACHE_LIMITS);
+}
+
 /**
  * Get autocomplete suggestions for card names
+ * Resolves to null when the request fails, so callers can tell a failure from "no matches"
  * @param query - Partial card name to search for
+ * @param options - Optional AbortSignal to cancel the request
  */
-export async function getCardNameAutocomplete(query: string): Promise<string[]> {
+export async function getCardNameAutocomplete(
+  query: string,
+  options: RequestOptions = {}
+): Promise<string[] | null> {
   if (!query || query.length < 2) {
     return [];
   }
   
+  const cacheEntryKey = AUTOCOMPLETE_CACHE_PREFIX + query.toLowerCase();
+  const cachedNames = await cacheGet<string[]>(cacheEntryKey, AUTOCOMPLETE_CACHE_MAX_AGE);
+  if (cachedNames) {
+    return cachedNames;
+  }
+  
   const endpoint = `/cards/autocomplete?q=${encodeURIComponent(query)}`;
   
   try {
-    const response = await makeRequest<ScryfallAutocompleteResponse>(endpoint);
+    const response = await makeRequest<ScryfallAutocompleteResponse>(endpoint, options);
+    void storeAutocompleteResponse(cacheEntryKey, response.data);
     return response.data;
   } catch (error) {
+    if (isAbortError(error)) {
+      throw error;
+    }
     console.error('Failed to get autocomplete suggestions:', error);
-    // Don't throw for autocomplete failures - just return empty array
-    return [];
+    // Don't throw for autocomplete failures - null marks the result as unusable for caching
+    return null;
+  }
+}
+
+const AUTOCOMPLETE_LIMIT = 8;
+const NAME_SEPARATOR = '\u0001'; // Sorts below every printable character
+
+/**
+ * Sorted card names packed into one lowercase string plus a Uint32Array of offsets,
+ * so prefix lookups are a binary search over contiguous memory
+ */
+interface CardNameIndex {
+  names: string[];
+  lowerNames: string;
+  offsets: Uint32Array;
+}
+
+function buildCardNameIndex(cardNames: Iterable<string>): CardNameIndex {
+  const entries = Array.from(cardNames, name => ({ name, lower: name.toLowerCase() }))
+    .sort((a, b) => (a.lower < b.lower ? -1 : a.lower > b.lower ? 1 : 0));
+  
+  const offsets = new Uint32Array(entries.length + 1);
+  let offset = 0;
+  entries.forEach((entry, i) => {
+    offsets[i] = offset;
+    offset += entry.lower.length + NAME_SEPARATOR.length;
+  });
+  offsets[entries.length] = offset;
+  
+  return {
+    names: entries.map(entry => entry.name),
+    lowerNames: entries.map(entry => entry.lower).join(NAME_SEPARATOR) + NAME_SEPARATOR,
+    offsets
+  };
+}
+
+/**
+ * Find the index range [start, end) of names beginning with a lowercase prefix
+ */
+function findPrefixRange(index: CardNameIndex, prefix: string): [number, number] {
+  const { lowerNames, offsets, names } = index;
+  const head = (i: number) => lowerNames.substring(offsets[i], offsets[i] + prefix.length);
+  
+  let low = 0;
+  let high = names.length;
+  while (low < high) {
+    const mid = (low + high) >>> 1;
+    if (head(mid) < prefix) low = mid + 1;
+    else high = mid;
   }
+  const start = low;
+  
+  high = names.length;
+  while (low < high) {
+    const mid = (low + high) >>> 1;
+    if (head(mid) === prefix) low = mid + 1;
+    else high = mid;
+  }
+  return [start, low];
 }
 
-// Cache for card names from selected sets
-let cardNamesCache: { [key: string]: string[] } = {};
+// Cache for card name indexes from selected sets
+let cardNameIndexCache: { [key: string]: CardNameIndex } = {};
 let cacheKey = '';
 
 /**
  * Get autocomplete suggestions for card names from specific sets only
  * Uses local filtering from cached card names for better performance
+ * The signal only cancels the global fallback request; building the name cache is shared work
+ * Resolves to null when the global fallback fails
  */
-export async function getCardNameAutocompleteFromSets(query: string, setCodes: string[]): Promise<string[]> {
+export async function getCardNameAutocompleteFromSets(
+  query: string,
+  setCodes: string[],
+  options: RequestOptions = {}
+): Promise<string[] | null> {
   if (!query || query.length < 2 || !setCodes || setCodes.length === 0) {
     return [];
   }
@@ -281,15 +472,28 @@ export async function getCardNameAutocompleteFromSets(query: string, setCodes: s
     const currentCacheKey = setCodes.sort().join(',');
     
     // If cache is stale or doesn't exist, rebuild it
-    if (cacheKey !== currentCacheKey || !cardNamesCache[currentCacheKey]) {
-      console.log(`Building card names cache for ${setCodes.length} sets...`);
+    // Reuse a name list persisted by an earlier session before hitting the API
+    if (cacheKey !== currentCacheKey || !cardNameIndexCache[currentCacheKey]) {
+      const storedNames = await cacheGet<string[]>(
+        SET_NAMES_CACHE_PREFIX + currentCacheKey,
+        AUTOCOMPLETE_CACHE_MAX_AGE
+      );
+      if (storedNames) {
+        cardNameIndexCache[currentCacheKey] = buildCardNameIndex(storedNames);
+        cacheKey = currentCacheKey;
+        if (DEBUG) console.log(`Loaded ${storedNames.length} card names for selected sets from cache`);
+      }
+    }
+    
+    if (cacheKey !== currentCacheKey || !cardNameIndexCache[currentCacheKey]) {
+      if (DEBUG) console.log(`Building card names cache for ${setCodes.length} sets...`);
       
       // Get first page of cards from selected sets to build name cache
       const searchResponse = await searchCardsMultipleSets(setCodes, 1);
       
       if (searchResponse.total_cards === 0) {
-        console.log('No cards found in selected sets, falling back to global autocomplete');
-        return await getCardNameAutocomplete(query);
+        if (DEBUG) console.log('No cards found in selected sets, falling back to global autocomplete');
+        return await getCardNameAutocomplete(query, options);
       }
       
       // Collect card names from multiple pages to build comprehensive cache
@@ -299,6 +503,7 @@ export async function getCardNameAutocompleteFromSets(query: string, setCodes: s
       searchResponse.data.forEach(card => allCardNames.add(card.name));
       
       // If there are more pages, get a few more to build better cache
+      let isComplete = true;
       if (searchResponse.has_more && searchResponse.total_cards > 175) {
         try {
           const page2 = await searchCardsMultipleSets(setCodes, 2);
@@ -309,39 +514,48 @@ export async function getCardNameAutocompleteFromSets(query: string, setCodes: s
             page3.data.forEach(card => allCardNames.add(card.name));
           }
         } catch (error) {
-          console.log('Could not fetch additional pages, using partial cache');
+          if (DEBUG) console.log('Could not fetch additional pages, using partial cache');
+          isComplete = false;
         }
       }
       
-      // Cache the card names
-      cardNamesCache[currentCacheKey] = Array.from(allCardNames).sort();
+      // Cache the card names as a sorted index
+      cardNameIndexCache[currentCacheKey] = buildCardNameIndex(allCardNames);
       cacheKey = currentCacheKey;
+      // A partial list is fine for this page session but shouldn't outlive it
+      if (isComplete) {
+        void storeSetNames(currentCacheKey, cardNameIndexCache[currentCacheKey].names);
+      }
       
-      console.log(`Cached ${cardNamesCache[currentCacheKey].length} unique card names from selected sets`);
+      if (DEBUG) console.log(`Cached ${cardNameIndexCache[currentCacheKey].names.length} unique card names from selected sets`);
     }
     
-    // Filter cached names based on query
+    // Names starting with the query come first, found by binary search
+    const index = cardNameIndexCache[currentCacheKey];
     const queryLower = query.toLowerCase();
-    const matchingNames = cardNamesCache[currentCacheKey]
-      .filter(name => name.toLowerCase().includes(queryLower))
-      .sort((a, b) => {
-        // Prioritize names that start with the query
-        const aStarts = a.toLowerCase().startsWith(queryLower);
-        const bStarts = b.toLowerCase().startsWith(queryLower);
-        if (aStarts && !bStarts) return -1;
-        if (!aStarts && bStarts) return 1;
-        return a.localeCompare(b);
-      })
-      .slice(0, 8); // Limit to 8 suggestions
+    const [start, end] = findPrefixRange(index, queryLower);
+    const matchingNames = index.names.slice(start, Math.min(end, start + AUTOCOMPLETE_LIMIT));
+    
+    // Fill remaining slots with names containing the query elsewhere
+    for (let i = 0; i < index.names.length && matchingNames.length < AUTOCOMPLETE_LIMIT; i++) {
+      if (i >= start && i < end) continue; // Already added as prefix matches
+      const lowerName = index.lowerNames.substring(index.offsets[i], index.offsets[i + 1] - 1);
+      if (lowerName.includes(queryLower)) {
+        matchingNames.push(index.names[i]);
+      }
+    }
     
-    console.log(`Found ${matchingNames.length} autocomplete matches in selected sets for "${query}"`);
+    if (DEBUG) console.log(`Found ${matchingNames.length} autocomplete matches in selected sets for "${query}"`);
     return matchingNames;
     
   } catch (error) {
+    if (isAbortError(error)) {
+      throw error;
+    }
     console.error('Set-specific autocomplete failed:', error);
     // Fallback to global autocomplete if caching fails
-    console.log('Falling back to global autocomplete');
-    return await getCardNameAutocomplete(query);
+    if (DEBUG) console.log('Falling back to global autocomplete');
+    return await getCardNameAutocomplete(query, options);
   }
 }
 
@@ -358,7 +572,7 @@ export async function generateMultipleChoiceOptions(
   selectedSets: string[]
 ): Promise<{ text: string; isCorrect: boolean }[]> {
   try {
-    console.log('Generating efficient multiple choice for:', correctCard.name);
+    if (DEBUG) console.log('Generating efficient multiple choice for:', correctCard.name);
     
     // Get one batch of random cards from the same search that found the correct card
     let availableCards: ScryfallCard[] = [];
@@ -367,7 +581,7 @@ export async function generateMultipleChoiceOptions(
       // Make ONE API call to get a bunch of cards
       const searchResponse = await searchCardsMultipleSets(selectedSets);
       availableCards = searchResponse.data || [];
-      console.log('Got', availableCards.length, 'cards from single API call');
+      if (DEBUG) console.log('Got', availableCards.length, 'cards from single API call');
     } catch (error) {
       console.warn('Failed to get card pool, using fallbacks:', error);
     }
@@ -410,7 +624,7 @@ export async function generateMultipleChoiceOptions(
       { text: wrongAnswers[2] || 'Giant Growth', isCorrect: false }
     ];
     
-    console.log('Efficient multiple choice options:', options.map(o => o.text));
+    if (DEBUG) console.log('Efficient multiple choice options:', options.map(o => o.text));
     
     // Shuffle the options so correct answer isn't always first
     return shuffleArray(options);